@@ -4,5 +4,9 @@ from .ga_utils import (
     account_date,
     execute_query,
     get_ga_data,
+    get_ga_data_async,
+    get_ga_data_batch,
+    get_ga_data_many,
+    get_services_for_customers,
     make_base_query,
 )
@@ -12,17 +12,24 @@ With that we can derive the authorizing account's customerId
 and get a GoogleAdsService instance with which to make a query.
 """
 
+import asyncio
 import boto3
+import cachetools
+import concurrent.futures
 import datetime
+import functools
+import google.ads.googleads.client
 from google.ads.googleads.client import GoogleAdsClient
+import keyword
+import logging
 from google.ads.googleads.errors import GoogleAdsException
 import google.ads.googleads.v16.services.services.google_ads_service.client as google_ads_client
 from google.api_core import exceptions
 from google.api_core.retry import Retry
-from google.protobuf.json_format import MessageToDict
 import pandas
 import pytz
 import re
+import threading
 import typing
 import yaml
 
@@ -39,15 +46,27 @@ CUSTOMER_CLIENT_QUERY = """
     WHERE customer_client.status='ENABLED'
 """
 
-client = boto3.client("ssm")
-response = client.get_parameter(Name="keys_google_adwords_api_keys.yml")
-GA_KEYS = yaml.safe_load(response["Parameter"]["Value"])
+logger = logging.getLogger(__name__)
+
+ssm_client = boto3.client("ssm")
+
+_KEEPALIVE_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
 
 CAMPAIGN_FROM_RESOURCE = "campaign"
 CAMPAIGN_FIELDS = ['campaign.id']
 
 MAX_RESULT_SIZE = 2000000
 
+# a 15s deadline forces large search/search_stream calls into retries
+# that redo work the server already did, so give them a minute
+_DEFAULT_RETRY = Retry(initial=1.0, maximum=8.0, multiplier=2.0, deadline=60.0)
+
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 CATEGORICAL_COLS = (
     "ad_group.status",
     "campaign.status",
@@ -61,49 +80,161 @@ CATEGORICAL_COLS = (
 )
 
 
-def make_base_ga_config_dict(refresh_token: str) -> dict:
+def _cache_non_none(maxsize: int) -> typing.Callable:
+    """
+    lru_cache-style memoizer that only stores non-None results, so a
+    transient failure (rate limit, auth hiccup) that makes the wrapped
+    function return None is retried on the next call instead of being
+    pinned for the life of the process
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            with lock:
+                if key in cache:
+                    return cache[key]
+
+            value = func(*args, **kwargs)
+            if value is not None:
+                with lock:
+                    while len(cache) >= maxsize:
+                        cache.pop(next(iter(cache)))
+
+                    cache[key] = value
+
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ga_keys() -> dict:
+    """
+    Fetch and parse the Google Ads API keys stored in SSM. Cached so
+    that repeated queries don't pay the SSM round-trip and YAML parse
+    every time a config dict is built.
+    """
+    response = ssm_client.get_parameter(Name="keys_google_adwords_api_keys.yml")
+    return yaml.safe_load(response["Parameter"]["Value"])
+
+
+def make_base_ga_config_dict(refresh_token: str, use_proto_plus: bool = True) -> dict:
     """
     Return a google ads api config dict
 
         Parameters:
             refresh_token (str): OAuth refresh token needed to access the account
 
+            use_proto_plus (bool): Whether response messages should be wrapped in
+            proto-plus objects. Read-only paths can pass False to skip the
+            per-message wrapping overhead. Default True.
+
         Returns:
             config_dict (dict): Google Ads API config info
     """
+    keys = _load_ga_keys()
     config_dict = dict(
         refresh_token=refresh_token,
-        client_id=GA_KEYS["client_id"],
-        client_secret=GA_KEYS["client_secret"],
-        developer_token=GA_KEYS["developer_token"],
-        use_proto_plus=True,
+        client_id=keys["client_id"],
+        client_secret=keys["client_secret"],
+        developer_token=keys["developer_token"],
+        use_proto_plus=use_proto_plus,
     )
     return config_dict
 
 
-def get_login_customer_id(cust_id: str, refresh_token: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _apply_keepalive_channel_options():
+    """
+    Add keepalive pings to the channel options the google-ads client
+    applies when building service transports, so long-lived batch jobs
+    don't have idle channels torn down between queries. The library has
+    no public hook for channel options, so this extends its private
+    module-level defaults; it runs once, and only when this package
+    actually builds a client, so importing us doesn't change gRPC
+    behavior for processes that never do.
+    """
+    options = getattr(google.ads.googleads.client, "_GRPC_CHANNEL_OPTIONS", None)
+    if not isinstance(options, list):
+        logger.warning(
+            "google-ads no longer exposes _GRPC_CHANNEL_OPTIONS as a list; "
+            "gRPC keepalive options not applied"
+        )
+        return
+
+    for option in _KEEPALIVE_CHANNEL_OPTIONS:
+        if option not in options:
+            options.append(option)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_ga_client(
+    refresh_token: str,
+    login_customer_id: str = None,
+    use_proto_plus: bool = True,
+) -> GoogleAdsClient:
+    """
+    Return a cached GoogleAdsClient for a refresh_token/login_customer_id
+    pair. ``GoogleAdsClient.load_from_dict`` is expensive enough that we
+    don't want to rebuild the client for every query.
+    """
+    _apply_keepalive_channel_options()
+    config_dict = make_base_ga_config_dict(refresh_token, use_proto_plus)
+    if login_customer_id is not None:
+        config_dict["login_customer_id"] = login_customer_id
+
+    return GoogleAdsClient.load_from_dict(config_dict)
+
+
+@cachetools.cached(cachetools.TTLCache(maxsize=128, ttl=3600), lock=threading.Lock())
+def list_accessible_customer_ids(refresh_token: str) -> typing.List[str]:
     """
-    Return login customer id with provided cust_id and refresh_token
+    Return customer Ids for all top-level accounts accessible by the
+    refresh_token. Cached with a one-hour TTL since account access
+    rarely changes.
 
         Parameters:
-            cust_id (str): Customer ID
-            refresh_token (str): OAuth refresh token needed to access the account
+            refresh_token (str): OAuth refresh token needed to access the accounts
 
         Returns:
-            (str) Login customer ID
+            direct_ids (typing.List[str]): Top-level account customer IDs
 
     """
-    config_dict = make_base_ga_config_dict(refresh_token)
-
-    # get customer Ids for all top-level accounts accessible by the
-    # refresh_token
-    client = GoogleAdsClient.load_from_dict(config_dict)
+    client = _load_ga_client(refresh_token)
 
     customer_service = client.get_service(
         "CustomerService", version=GOOGLE_ADS_API_VERSION
     )
     resource_names = customer_service.list_accessible_customers().resource_names
     direct_ids = [rn.replace("customers/", "") for rn in resource_names]
+    return direct_ids
+
+
+@_cache_non_none(maxsize=1024)
+def get_login_customer_id(cust_id: str, refresh_token: str) -> str:
+    """
+    Return login customer id with provided cust_id and refresh_token.
+    The parent/login mapping is stable, so the result is memoized to
+    avoid re-walking every top-level account on each call.
+
+        Parameters:
+            cust_id (str): Customer ID
+            refresh_token (str): OAuth refresh token needed to access the account
+
+        Returns:
+            (str) Login customer ID
+
+    """
+    client = _load_ga_client(refresh_token)
+
+    direct_ids = list_accessible_customer_ids(refresh_token)
     # if cust_id is a top-level account for this refresh_token, then assume
     # it is also the login customerId
     if cust_id in direct_ids:
@@ -120,7 +251,7 @@ def get_login_customer_id(cust_id: str, refresh_token: str) -> str:
             response = google_ads_service.search(
                 customer_id=parent_id,
                 query=CUSTOMER_CLIENT_QUERY,
-                retry=Retry(maximum=8, deadline=15),
+                retry=_DEFAULT_RETRY,
             )
         except GoogleAdsException:
             continue
@@ -152,27 +283,131 @@ def build_config_dict(cust_id: str) -> dict:
     return config_dict
 
 
-def get_ga_api_service(cust_id: str, service_name: str) -> google_ads_client.GoogleAdsServiceClient:
+def get_ga_client(cust_id: str, use_proto_plus: bool = True) -> GoogleAdsClient:
     """
-    Return a service client instance for the specified service_name
+    Return a cached GoogleAdsClient authorized for the provided cust_id
+
+        Parameters:
+            cust_id (str): Customer ID
+
+            use_proto_plus (bool): Whether response messages should be wrapped in
+            proto-plus objects. Default True.
+
+        Returns:
+            client (GoogleAdsClient): Google Ads API client
+
+    """
+    refresh_token = cust_id_to_refresh_token(cust_id)
+    if refresh_token is None:
+        return None
+
+    login_customer_id = get_login_customer_id(cust_id, refresh_token)
+    return _load_ga_client(refresh_token, login_customer_id, use_proto_plus)
+
+
+@_cache_non_none(maxsize=128)
+def get_ga_api_service(
+    cust_id: str, service_name: str, use_proto_plus: bool = True
+) -> google_ads_client.GoogleAdsServiceClient:
+    """
+    Return a service client instance for the specified service_name.
+    Cached per (cust_id, service_name) so repeat calls skip client
+    construction entirely.
 
         Parameters:
             cust_id (str): Customer ID
             service_name (str): Google Ads Client service name
 
+            use_proto_plus (bool): Whether response messages should be wrapped in
+            proto-plus objects. Default True.
+
         Returns:
             service (google_ads_client.GoogleAdsServiceClient): Google Ads Client service
 
     """
-    config_dict = build_config_dict(cust_id)
-    if not config_dict:
+    client = get_ga_client(cust_id, use_proto_plus)
+    if client is None:
         return None
 
-    client = GoogleAdsClient.load_from_dict(config_dict)
     service = client.get_service(service_name, version=GOOGLE_ADS_API_VERSION)
     return service
 
 
+def get_services_for_customers(
+    cust_ids: typing.List[str], service_name: str = "GoogleAdsService"
+) -> typing.Dict[str, google_ads_client.GoogleAdsServiceClient]:
+    """
+    Return service client instances for many customer accounts at once.
+
+    Accounts are grouped by refresh token so that the accessible-customer
+    listing happens once per token and each parent account is enumerated
+    with a single customer_client query, instead of rediscovering the
+    login customer id independently for every cust_id.
+
+        Parameters:
+            cust_ids (typing.List[str]): Customer IDs
+            service_name (str): Google Ads Client service name. Default "GoogleAdsService".
+
+        Returns:
+            services (typing.Dict[str, google_ads_client.GoogleAdsServiceClient]):
+            Map of cust_id to service instance. Accounts with no refresh token
+            or no reachable parent map to None.
+
+    """
+    services = {}
+    by_token = {}
+    for cust_id in cust_ids:
+        refresh_token = cust_id_to_refresh_token(cust_id)
+        if refresh_token is None:
+            services[cust_id] = None
+            continue
+
+        by_token.setdefault(refresh_token, []).append(cust_id)
+
+    for refresh_token, token_cust_ids in by_token.items():
+        direct_ids = list_accessible_customer_ids(refresh_token)
+        login_ids = {c: c for c in token_cust_ids if c in direct_ids}
+
+        # resolve the remaining sub-accounts by enumerating each parent's
+        # children once, instead of once per sub-account
+        remaining = set(token_cust_ids) - set(login_ids)
+        if remaining:
+            google_ads_service = _load_ga_client(refresh_token).get_service(
+                "GoogleAdsService", version=GOOGLE_ADS_API_VERSION
+            )
+            for parent_id in direct_ids:
+                if not remaining:
+                    break
+
+                try:
+                    response = google_ads_service.search(
+                        customer_id=parent_id,
+                        query=CUSTOMER_CLIENT_QUERY,
+                        retry=_DEFAULT_RETRY,
+                    )
+                except GoogleAdsException:
+                    continue
+
+                for result in response.results:
+                    child_id = str(result.customer_client.id)
+                    if child_id in remaining:
+                        login_ids[child_id] = parent_id
+                        remaining.discard(child_id)
+
+        for cust_id in token_cust_ids:
+            login_customer_id = login_ids.get(cust_id)
+            if login_customer_id is None:
+                services[cust_id] = None
+                continue
+
+            client = _load_ga_client(refresh_token, login_customer_id)
+            services[cust_id] = client.get_service(
+                service_name, version=GOOGLE_ADS_API_VERSION
+            )
+
+    return services
+
+
 def camel_to_snake(camel_string: str) -> str:
     """
     Convert and return a string from camel case to snake case
@@ -184,8 +419,7 @@ def camel_to_snake(camel_string: str) -> str:
             snake_string (str) Converted snake case string
 
     """
-    pattern = re.compile(r"(?<!^)(?=[A-Z])")
-    snake_string = pattern.sub("_", camel_string).lower()
+    snake_string = _CAMEL_SPLIT_RE.sub("_", camel_string).lower()
     return snake_string
 
 
@@ -206,6 +440,15 @@ def snake_to_camel(snake_string: str) -> str:
     return camel_string
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_path(key: str) -> tuple:
+    """
+    Split a dotted field path into its components once and cache the
+    result, since the same keys are looked up row after row
+    """
+    return tuple(key.split("."))
+
+
 def get_nested_dict_value(key: str, nested_dict: dict) -> typing.Union[dict, str, int, float]:
     """
     Return value from a nested dict by key
@@ -218,7 +461,7 @@ def get_nested_dict_value(key: str, nested_dict: dict) -> typing.Union[dict, str
             value (dict | str | int | float): value of the key from nested dict
 
     """
-    keys = key.split(".")
+    keys = _split_path(key)
     value = nested_dict
     for k in keys:
         if k not in value:
@@ -229,6 +472,94 @@ def get_nested_dict_value(key: str, nested_dict: dict) -> typing.Union[dict, str
     return value
 
 
+def _walk_proto_path(obj: typing.Any, path: typing.List[str]) -> typing.Any:
+    """
+    Follow a pre-split attribute path down a GoogleAdsRow message and
+    return the value at the end, or None if any link is missing
+    """
+    for attr in path:
+        obj = getattr(obj, attr, None)
+        if obj is None:
+            return None
+
+    return obj
+
+
+@functools.lru_cache(maxsize=128)
+def _make_unpacker(fields: tuple) -> typing.Callable:
+    """
+    Compile a function that extracts the values for ``fields`` from a
+    GoogleAdsRow message as a list. Hardcoding the attribute chains
+    avoids the per-row, per-field interpretation of generic path
+    walking in the query hot loop, and submessages shared by several
+    fields (e.g. ``metrics``) are looked up once per row instead of
+    once per field.
+    """
+    paths = [field.split(".") for field in fields]
+
+    # fall back to the generic walker if a field isn't a plain
+    # attribute path (isidentifier alone would let keywords through and
+    # break the exec below)
+    if not all(
+        part.isidentifier() and not keyword.iskeyword(part)
+        for path in paths
+        for part in path
+    ):
+        return lambda result: [_walk_proto_path(result, path) for path in paths]
+
+    # hoist submessages that more than one field hangs off of into a
+    # local, in first-appearance order
+    counts = {}
+    for path in paths:
+        if len(path) > 1:
+            counts[path[0]] = counts.get(path[0], 0) + 1
+
+    hoisted = [name for name, count in counts.items() if count > 1]
+
+    lines = [f"    _{name} = result.{name}" for name in hoisted]
+    exprs = []
+    for path in paths:
+        if len(path) > 1 and path[0] in hoisted:
+            exprs.append("_" + ".".join(path))
+        else:
+            exprs.append("result." + ".".join(path))
+
+    lines.append("    return [" + ", ".join(exprs) + "]")
+    namespace = {}
+    exec("def _unpack(result):\n" + "\n".join(lines) + "\n", namespace)
+    return namespace["_unpack"]
+
+
+_account_timezones = {}
+
+
+def account_timezone(cust_id: str) -> datetime.tzinfo:
+    """
+    Returns the timezone for an account. Cached indefinitely, since an
+    account's timezone never changes, so only the first call pays the
+    API round-trip.
+
+        Parameters:
+            cust_id (str): ``customer.id`` for the Google Ads account
+
+        Returns:
+            timezone (datetime.tzinfo): Account's timezone
+
+    """
+    timezone = _account_timezones.get(cust_id)
+    if timezone is None:
+        service = get_ga_api_service(cust_id, "GoogleAdsService")
+        query = "SELECT customer.time_zone FROM customer LIMIT 1"
+        response = service.search(
+            customer_id=cust_id, query=query, retry=_DEFAULT_RETRY
+        )
+        row = next(iter(response))
+        timezone = pytz.timezone(row.customer.time_zone)
+        _account_timezones[cust_id] = timezone
+
+    return timezone
+
+
 def account_time(cust_id: str) -> datetime.datetime:
     """
     Returns a timezone-aware datetime that represents the current
@@ -241,13 +572,7 @@ def account_time(cust_id: str) -> datetime.datetime:
             account_time (datetime.datetime): Account's current time
 
     """
-    service = get_ga_api_service(cust_id, "GoogleAdsService")
-    query = "SELECT customer.time_zone FROM customer"
-    response = service.search(
-        customer_id=cust_id, query=query, retry=Retry(maximum=8, deadline=15)
-    )
-    row = list(response)[0]
-    timezone = pytz.timezone(row.customer.time_zone)
+    timezone = account_timezone(cust_id)
     account_time = datetime.datetime.utcnow().astimezone(timezone)
     return account_time
 
@@ -266,6 +591,50 @@ def account_date(custId: str) -> datetime.date:
     return date
 
 
+def _date_where_clause(
+    start: datetime.date, end: datetime.date, today: datetime.date = None
+) -> str:
+    """
+    Build the segments.date predicate for a GAQL query, preferring the
+    GAQL ``DURING`` keywords for standard windows since the API can
+    optimize those better than open-ended range comparisons
+    """
+    if today is not None:
+        if start == end == today:
+            return "segments.date DURING TODAY"
+
+        # LAST_N_DAYS windows end yesterday in GAQL
+        days = (end - start).days + 1
+        if end == today - datetime.timedelta(days=1) and days in (7, 14, 30):
+            return f"segments.date DURING LAST_{days}_DAYS"
+
+    start_str = start.strftime("%Y-%m-%d")
+    end_str = end.strftime("%Y-%m-%d")
+    return f"segments.date >= '{start_str}' AND segments.date <= '{end_str}'"
+
+
+def _validate_where_clause(where: str):
+    """
+    Reject caller-supplied 'WHERE' clauses that could break out of the
+    query, since they are interpolated into the GAQL string. GAQL string
+    literals may be single- or double-quoted, so quotes and semicolons
+    inside a literal are fine; a semicolon outside any literal or an
+    unterminated literal is not.
+    """
+    open_quote = None
+    for char in where:
+        if open_quote is not None:
+            if char == open_quote:
+                open_quote = None
+        elif char in ("'", '"'):
+            open_quote = char
+        elif char == ";":
+            raise ValueError(f"invalid GAQL where clause: {where!r}")
+
+    if open_quote is not None:
+        raise ValueError(f"invalid GAQL where clause: {where!r}")
+
+
 def make_base_query(
     cust_id: str,
     from_resource: str,
@@ -298,7 +667,14 @@ def make_base_query(
             query (str): A fully formed GAQL query.
 
     """
-    today = account_date(cust_id)
+    # only look up the account's current date when we actually need a
+    # default or when the timezone cache is already warm and the lookup
+    # is pure arithmetic; callers that pass both dates for an account we
+    # haven't seen skip the round-trip
+    today = None
+    if start is None or end is None or cust_id in _account_timezones:
+        today = account_date(cust_id)
+
     if start is None:
         start = today
 
@@ -319,11 +695,7 @@ def make_base_query(
     if zero_impressions is False:
         wheres.append("metrics.impressions > 0")
 
-    start_str = start.strftime("%Y-%m-%d")
-    wheres.append(f"segments.date >= '{start_str}'")
-
-    end_str = end.strftime("%Y-%m-%d")
-    wheres.append(f"segments.date <= '{end_str}'")
+    wheres.append(_date_where_clause(start, end, today))
 
     whereclause = " AND ".join(wheres)
     query += f" WHERE {whereclause}"
@@ -349,56 +721,157 @@ def convert_to_category_dtype(df: pandas.DataFrame) -> pandas.DataFrame:
     return df
 
 
-def execute_query(
-    cust_id: str, query: str, fields: typing.List[str]
+def convert_to_numeric_dtypes(df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Coerce metric, id, and date columns out of object dtype so that
+    downstream aggregations run at native array speeds instead of
+    per-object speeds
+
+        Parameters:
+            df (pandas.DataFrame): dataframe to be converted
+
+        Returns:
+            df (pandas.DataFrame): converted dataframe
+
+    """
+    for col in df.columns:
+        if col == "segments.date":
+            df[col] = pandas.to_datetime(df[col])
+        elif col.startswith("metrics.") or col.endswith(".id"):
+            # not every metric is a scalar numeric (e.g. the repeated
+            # metrics.interaction_event_types), so leave anything that
+            # doesn't coerce as object dtype
+            try:
+                df[col] = pandas.to_numeric(df[col], downcast="integer")
+            except (ValueError, TypeError):
+                pass
+
+    return df
+
+
+def _results_to_columns(
+    results: typing.Iterable, fields: typing.List[str], unpack: typing.Callable
+) -> dict:
+    """
+    Unpack an iterable of GoogleAdsRow messages into one list of values
+    per field
+    """
+    cols = {field: [] for field in fields}
+    for result in results:
+        for field, value in zip(fields, unpack(result)):
+            cols[field].append(value)
+
+    return cols
+
+
+def _results_to_frame(
+    results: typing.Iterable, fields: typing.List[str], unpack: typing.Callable
 ) -> pandas.DataFrame:
+    """
+    Unpack an iterable of GoogleAdsRow messages into a DataFrame with
+    one column per field
+    """
+    return pandas.DataFrame(_results_to_columns(results, fields, unpack), copy=False)
+
+
+def _columns_to_arrow_table(chunks: typing.List[dict], fields: typing.List[str]):
+    """
+    Assemble per-batch column buffers into a pyarrow Table. pyarrow is
+    an optional dependency (install with the ``[arrow]`` extra), so it
+    is imported lazily.
+    """
+    import pyarrow
+
+    arrays = {}
+    for field in fields:
+        values = [value for chunk in chunks for value in chunk[field]]
+        if field == "segments.date":
+            dates = [
+                datetime.date.fromisoformat(value) if value else None
+                for value in values
+            ]
+            arrays[field] = pyarrow.array(dates, type=pyarrow.date32())
+        else:
+            # numeric fields infer as int64/float64, everything else as
+            # its native scalar type
+            arrays[field] = pyarrow.array(values)
+
+    return pyarrow.table(arrays)
+
+
+def execute_query(
+    cust_id: str,
+    query: str,
+    fields: typing.List[str],
+    retry: Retry = _DEFAULT_RETRY,
+    output: str = "pandas",
+) -> typing.Union[pandas.DataFrame, "pyarrow.Table"]:
     """
     Execute a GAQL query using ``GoogleAdsService.SearchStream``
-    and return the results in a pandas DataFrame
+    and return the results in a pandas DataFrame or a pyarrow Table
 
         Parameters:
             cust_id (str): The Google Ads ``customer.id`` resource for the account.
             query (str): A fully-formed GAQL query.
             fields (typing.List[str]): The Google Ads API resource fields that are selected in the query
 
+            retry (Retry): Retry policy for the search calls. Override for
+            queries that need a longer deadline than the default 60s.
+
+            output (str): "pandas" (default) or "arrow". Callers that push
+            results on to Parquet/BigQuery/Polars can request an arrow Table
+            and skip the pandas intermediate entirely. Requires pyarrow.
+
         Returns:
-            A pandas DataFrame with data for each of the requested fields.
+            A pandas DataFrame or pyarrow Table with data for each of the
+            requested fields.
 
     """
-    camel_fields = [snake_to_camel(f) for f in fields]
+    if output not in ("pandas", "arrow"):
+        raise ValueError(f"unknown output format: {output!r}")
 
-    service = get_ga_api_service(cust_id, "GoogleAdsService")
+    unpack = _make_unpacker(tuple(fields))
+
+    # raw protobuf messages skip the proto-plus wrapper allocation per
+    # message; the unpacker only reads scalar leaves, which look the
+    # same either way
+    service = get_ga_api_service(cust_id, "GoogleAdsService", use_proto_plus=False)
     stream = service.search_stream(
         customer_id=cust_id,
         query=query,
-        retry=Retry(maximum=20, deadline=60)
+        retry=retry
     )
 
-    rows = []
+    if output == "arrow":
+        def make_chunk(results):
+            return _results_to_columns(results, fields, unpack)
+    else:
+        def make_chunk(results):
+            return _results_to_frame(results, fields, unpack)
+
+    # one chunk per stream batch keeps peak memory at a batch's worth of
+    # Python objects instead of the whole result set's
+    chunks = []
     try:
         for batch in stream:
-            for result in batch.results:
-                result_dict = MessageToDict(result._pb)
-                row = []
-                for field in camel_fields:
-                    row.append(get_nested_dict_value(field, result_dict))
-
-                rows.append(row)
+            chunks.append(make_chunk(batch.results))
     except exceptions.Unknown:
         response = service.search(
             customer_id=cust_id,
             query=query,
-            retry=Retry(maximum=20, deadline=60)
+            retry=retry
         )
-        for result in response:
-            result_dict = MessageToDict(result._pb)
-            row = []
-            for field in camel_fields:
-                row.append(get_nested_dict_value(field, result_dict))
+        chunks = [make_chunk(response)]
 
-            rows.append(row)
+    if output == "arrow":
+        return _columns_to_arrow_table(chunks, fields)
 
-    df = pandas.DataFrame(rows, columns=fields)
+    if chunks:
+        df = pandas.concat(chunks, ignore_index=True)
+    else:
+        df = pandas.DataFrame(columns=fields)
+
+    df = convert_to_numeric_dtypes(df)
     return convert_to_category_dtype(df)
 
 
@@ -415,8 +888,7 @@ def check_result_size(cust_id: str, query: str) -> int:
             count (int): An int indicates number of results we'll get from this query.
 
     """
-    config_dict = build_config_dict(cust_id)
-    client = GoogleAdsClient.load_from_dict(config_dict)
+    client = get_ga_client(cust_id)
     search_request = client.get_type("SearchGoogleAdsRequest")
 
     query_split = query.split('FROM')
@@ -429,7 +901,7 @@ def check_result_size(cust_id: str, query: str) -> int:
     search_request.return_total_results_count = True
 
     service = client.get_service("GoogleAdsService", version=GOOGLE_ADS_API_VERSION)
-    results = service.search(request=search_request)
+    results = service.search(request=search_request, retry=_DEFAULT_RETRY)
 
     count = results.total_results_count
     return count
@@ -472,8 +944,101 @@ def get_ga_data(
     query = make_base_query(cust_id, from_resource, fields, start, end, zero_impressions)
 
     if wheres:
+        for where in wheres:
+            _validate_where_clause(where)
+
         query += " AND " + " AND ".join(wheres)
 
     df = execute_query(cust_id, query, fields)
 
     return df
+
+
+async def get_ga_data_async(
+    cust_id: str,
+    from_resource: str,
+    fields: typing.List[str],
+    start: typing.Union[datetime.date, datetime.datetime] = None,
+    end: typing.Union[datetime.date, datetime.datetime] = None,
+    zero_impressions: bool = False,
+    wheres: typing.List[str] = [],
+) -> pandas.DataFrame:
+    """
+    Async version of ``get_ga_data``. The query runs in a worker thread
+    (gRPC releases the GIL while waiting on the network), so multiple
+    accounts can be fetched concurrently with ``asyncio.gather`` or
+    ``get_ga_data_many``.
+
+    Parameters and return value are the same as ``get_ga_data``.
+
+    """
+    return await asyncio.to_thread(
+        get_ga_data, cust_id, from_resource, fields, start, end,
+        zero_impressions, wheres,
+    )
+
+
+async def get_ga_data_many(
+    cust_ids: typing.List[str],
+    from_resource: str,
+    fields: typing.List[str],
+    start: typing.Union[datetime.date, datetime.datetime] = None,
+    end: typing.Union[datetime.date, datetime.datetime] = None,
+    zero_impressions: bool = False,
+    wheres: typing.List[str] = [],
+    max_concurrency: int = 8,
+) -> typing.List[pandas.DataFrame]:
+    """
+    Get Google Ads data for several customer accounts concurrently
+
+        Parameters:
+            cust_ids (typing.List[str]): ``customer.id`` resources to fetch data for.
+
+            max_concurrency (int): Maximum number of in-flight queries, to stay
+            within Google Ads API rate limits. Default is 8.
+
+            All other parameters are the same as ``get_ga_data`` and are applied
+            to every account.
+
+        Returns:
+            dfs (typing.List[pandas.DataFrame]): One DataFrame per cust_id, in order.
+
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(cust_id: str) -> pandas.DataFrame:
+        async with semaphore:
+            return await get_ga_data_async(
+                cust_id, from_resource, fields, start, end,
+                zero_impressions, wheres,
+            )
+
+    return list(await asyncio.gather(*(fetch(cust_id) for cust_id in cust_ids)))
+
+
+def get_ga_data_batch(
+    requests: typing.List[dict], max_workers: int = 16
+) -> typing.List[pandas.DataFrame]:
+    """
+    Get Google Ads data for many queries concurrently from synchronous code.
+
+    The workload is almost entirely I/O wait on gRPC, which releases the
+    GIL, so fan-out across a thread pool gives near-linear speedup up to
+    the API's rate limits. Keep max_workers modest to stay within
+    per-account quotas; the shared retry policy backs off if the API
+    pushes back.
+
+        Parameters:
+            requests (typing.List[dict]): One dict of keyword arguments for
+            ``get_ga_data`` per query. For example
+            ``{"cust_id": "1234567890", "from_resource": "campaign", "fields": [...]}``.
+
+            max_workers (int): Maximum number of concurrent queries. Default is 16.
+
+        Returns:
+            dfs (typing.List[pandas.DataFrame]): One DataFrame per request, in order.
+
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_ga_data, **request) for request in requests]
+        return [future.result() for future in futures]
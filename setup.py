@@ -6,10 +6,14 @@ setup(
     author='MotiveMetrics',
     install_requires=[
         'boto3',
+        'cachetools',
         'google-ads',
         'pandas',
         'PyMongo',
         'PyYAML'
     ],
+    extras_require={
+        'arrow': ['pyarrow']
+    },
     packages=['google_ads_data']
 )
@@ -0,0 +1,29 @@
+import pytest
+
+from google_ads_data.ga_utils import _validate_where_clause
+
+
+def test_plain_clause_passes():
+    _validate_where_clause("metrics.impressions > 0")
+
+
+def test_apostrophe_in_double_quoted_literal_passes():
+    _validate_where_clause('campaign.name = "men\'s shoes"')
+
+
+def test_semicolon_in_literal_passes():
+    _validate_where_clause("campaign.name = 'a;b'")
+
+
+def test_double_quote_in_single_quoted_literal_passes():
+    _validate_where_clause("campaign.name = 'say \"hi\"'")
+
+
+def test_semicolon_outside_literal_rejected():
+    with pytest.raises(ValueError):
+        _validate_where_clause("campaign.name = 'x'; SELECT")
+
+
+def test_unterminated_literal_rejected():
+    with pytest.raises(ValueError):
+        _validate_where_clause("campaign.name = 'oops")